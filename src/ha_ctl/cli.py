@@ -2,21 +2,31 @@
 
 from __future__ import annotations
 
+import functools
 import json
+import re
 import sys
+import threading
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, Any, List, Optional
 
 import typer
 from rich.console import Console
-from rich.table import Table
 
 from . import __version__
-from .client import HomeAssistantClient
 from .config import Config, init_config, load_config
 from .logger import log_action, setup_logging
-from .models import ApiError, CriticalActionError
-from .safety import check_action
+from .models import ApiError, CriticalActionError, domain_of
+from .safety import check_action, check_actions
+
+if TYPE_CHECKING:
+    from .client import HomeAssistantClient
+
+# Optional fast JSON encoder (install with: pip install 'moltbot-ha[speed]')
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
 app = typer.Typer(
     name="moltbot-ha",
@@ -26,17 +36,101 @@ app = typer.Typer(
 
 console = Console()
 
-# Global config for access in commands
-_global_config: Optional[Config] = None
+# Guards one-time logging setup so handlers are installed exactly once,
+# even if get_config() is called from multiple threads.
+_logging_lock = threading.Lock()
+_logging_initialized = False
+
+
+@functools.lru_cache(maxsize=1)
+def _load_config_cached() -> Config:
+    """Load configuration once per process (thread-safe via lru_cache)."""
+    return load_config()
 
 
 def get_config() -> Config:
     """Get loaded configuration."""
-    global _global_config
-    if _global_config is None:
-        _global_config = load_config()
-        setup_logging(_global_config.logging)
-    return _global_config
+    global _logging_initialized
+
+    config = _load_config_cached()
+
+    if not _logging_initialized:
+        with _logging_lock:
+            if not _logging_initialized:
+                setup_logging(config.logging)
+                _logging_initialized = True
+
+    return config
+
+
+def _print_json(data: Any, pretty: bool = True) -> None:
+    """Write JSON to stdout directly, using orjson when available.
+
+    Bypasses console.print so large payloads skip Rich's re-parsing and
+    syntax highlighting; orjson additionally serializes straight to bytes.
+    """
+    # Serialize the full payload (newline included) before writing, so the
+    # output goes out in one write instead of Rich-style chunked writes.
+    # default=dict converts the shared empty MappingProxyType that
+    # EntityState uses for attribute-less entities.
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        sys.stdout.buffer.write(orjson.dumps(data, option=option, default=dict) + b"\n")
+        sys.stdout.buffer.flush()
+        return
+
+    if pretty:
+        sys.stdout.write(json.dumps(data, indent=2, default=dict) + "\n")
+    else:
+        sys.stdout.write(json.dumps(data, separators=(",", ":"), default=dict) + "\n")
+
+
+# Boolean aliases accepted in key=value arguments. The set command takes
+# the wide sets (on/off included); call keeps the narrow ones, because
+# "on"/"off" are legitimate string values for service parameters like
+# hvac_mode or preset_mode and must not be coerced there.
+_TRUE_VALUES = frozenset({"true", "yes", "on"})
+_FALSE_VALUES = frozenset({"false", "no", "off"})
+_CALL_TRUE_VALUES = frozenset({"true", "yes"})
+_CALL_FALSE_VALUES = frozenset({"false", "no"})
+
+# Fast-path numeric check; avoids raising/catching ValueError for plain strings
+_NUM_RE = re.compile(r"^-?\d+(\.\d+)?([eE][-+]?\d+)?$")
+
+
+def _parse_value(
+    value: str,
+    true_values: frozenset = _TRUE_VALUES,
+    false_values: frozenset = _FALSE_VALUES,
+) -> Any:
+    """Parse a key=value argument value into bool, int, float, or str."""
+    lowered = value.lower()
+    if lowered in true_values:
+        return True
+    if lowered in false_values:
+        return False
+    if _NUM_RE.match(value):
+        return float(value) if "." in value or "e" in lowered else int(value)
+    return value
+
+
+def _parse_kv(
+    pair: str,
+    true_values: frozenset = _TRUE_VALUES,
+    false_values: frozenset = _FALSE_VALUES,
+) -> tuple:
+    """Split one key=value argument and parse its value.
+
+    str.partition scans the string once without allocating a list, unlike
+    split("=", 1).
+
+    Raises:
+        ValueError: If the argument contains no '='.
+    """
+    key, sep, value = pair.partition("=")
+    if not sep:
+        raise ValueError(f"Invalid format: {pair}")
+    return key, _parse_value(value, true_values, false_values)
 
 
 def get_client() -> HomeAssistantClient:
@@ -48,6 +142,10 @@ def get_client() -> HomeAssistantClient:
     Raises:
         typer.Exit: If configuration is invalid
     """
+    # Deferred import: pulling in requests costs ~100 ms and is only needed
+    # by commands that actually talk to Home Assistant.
+    from .client import HomeAssistantClient
+
     try:
         config = get_config()
         return HomeAssistantClient(config.server.url, config.server.token)
@@ -106,11 +204,7 @@ def list(
     """List all entities or filter by domain."""
     try:
         client = get_client()
-        states = client.get_states()
-
-        # Filter by domain if specified
-        if domain:
-            states = [s for s in states if s.domain == domain]
+        states = client.get_states(domain=domain)
 
         if not states:
             if domain:
@@ -130,17 +224,28 @@ def list(
                 }
                 for s in states
             ]
-            console.print(json.dumps(data, indent=2))
+            # Pretty-print on a terminal, compact when piped
+            _print_json(data, pretty=console.is_terminal)
+            return
+
+        # Piped: plain tab-separated lines, one write, no table machinery
+        if not console.is_terminal:
+            sys.stdout.write(
+                "\n".join(f"{s.entity_id}\t{s.state}\t{s.friendly_name}" for s in states) + "\n"
+            )
             return
 
-        # Table output
+        # Table output (rich.table imported lazily; only this command needs it)
+        from rich.table import Table
+
         table = Table(title=f"Entities{f' ({domain})' if domain else ''}")
         table.add_column("Entity ID", style="cyan")
         table.add_column("State", style="green")
         table.add_column("Friendly Name", style="yellow")
 
-        for state in states:
-            table.add_row(state.entity_id, state.state, state.friendly_name)
+        rows = [(s.entity_id, s.state, s.friendly_name) for s in states]
+        for row in rows:
+            table.add_row(*row)
 
         console.print(table)
 
@@ -171,7 +276,7 @@ def state(
             "last_changed": entity_state.last_changed.isoformat(),
             "last_updated": entity_state.last_updated.isoformat(),
         }
-        console.print(json.dumps(output, indent=2))
+        _print_json(output, pretty=console.is_terminal)
 
     except ApiError as e:
         console.print(f"[red]Error:[/red] {e}")
@@ -301,38 +406,20 @@ def set(
         # Parse attributes
         data = {"entity_id": entity_id}
         for attr_str in attributes:
-            if "=" not in attr_str:
+            try:
+                key, value = _parse_kv(attr_str)
+            except ValueError:
                 console.print(f"[red]Error:[/red] Invalid attribute format: {attr_str}")
                 console.print("[yellow]Expected format:[/yellow] key=value")
                 raise typer.Exit(1)
 
-            key, value = attr_str.split("=", 1)
-
-            # Try to parse as number or boolean
-            if value.lower() in ("true", "yes", "on"):
-                parsed_value = True
-            elif value.lower() in ("false", "no", "off"):
-                parsed_value = False
-            else:
-                try:
-                    # Try int
-                    parsed_value = int(value)
-                except ValueError:
-                    try:
-                        # Try float
-                        parsed_value = float(value)
-                    except ValueError:
-                        # Keep as string
-                        parsed_value = value
-
-            data[key] = parsed_value
+            data[key] = value
 
         # Safety check
         check_action(entity_id, "set", config.safety, force)
 
         # Execute (use turn_on service with attributes)
-        domain = entity_id.split(".", 1)[0]
-        client.call_service(domain, "turn_on", data)
+        client.call_service(domain_of(entity_id), "turn_on", data)
 
         # Log
         log_action(entity_id, "set", forced=force, allowed=True)
@@ -387,29 +474,15 @@ def call(
             data = {}
             if params:
                 for param_str in params:
-                    if "=" not in param_str:
+                    try:
+                        key, value = _parse_kv(param_str, _CALL_TRUE_VALUES, _CALL_FALSE_VALUES)
+                    except ValueError:
                         console.print(
                             f"[red]Error:[/red] Invalid parameter format: {param_str}",
                         )
                         raise typer.Exit(1)
 
-                    key, value = param_str.split("=", 1)
-
-                    # Parse value
-                    if value.lower() in ("true", "yes"):
-                        parsed_value = True
-                    elif value.lower() in ("false", "no"):
-                        parsed_value = False
-                    else:
-                        try:
-                            parsed_value = int(value)
-                        except ValueError:
-                            try:
-                                parsed_value = float(value)
-                            except ValueError:
-                                parsed_value = value
-
-                    data[key] = parsed_value
+                    data[key] = value
 
         # Safety check if entity_id present
         if "entity_id" in data and not force:
@@ -432,6 +505,184 @@ def call(
         raise typer.Exit(1)
 
 
+# ============================================================================
+# BATCH COMMAND
+# ============================================================================
+
+
+@app.command()
+def batch(
+    file: Path = typer.Argument(
+        ..., help='JSONL file of actions: {"entity_id": ..., "service": ..., "data": {...}}'
+    ),
+    force: bool = typer.Option(False, "--force", help="Force actions (skip confirmation)"),
+) -> None:
+    """Run multiple service calls from a JSONL file in as few requests as possible.
+
+    Actions sharing the same domain, service, and extra data are coalesced
+    into a single API call carrying a list of entity IDs (Home Assistant
+    accepts entity_id arrays), so toggling N lights costs one round-trip
+    instead of N.
+    """
+    try:
+        config = get_config()
+        client = get_client()
+
+        try:
+            lines = file.read_text().splitlines()
+        except OSError as e:
+            console.print(f"[red]Error:[/red] Cannot read {file}: {e}")
+            raise typer.Exit(1)
+
+        # Parse actions
+        actions = []
+        for lineno, line in enumerate(lines, start=1):
+            line = line.strip()
+            if not line:
+                continue
+
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError as e:
+                console.print(f"[red]Error:[/red] Invalid JSON on line {lineno}: {e}")
+                raise typer.Exit(1)
+
+            # Valid JSON is not necessarily an object; guard before the
+            # membership tests so a bare scalar reports the line instead
+            # of raising TypeError
+            if not isinstance(entry, dict) or "entity_id" not in entry or "service" not in entry:
+                console.print(
+                    f"[red]Error:[/red] Line {lineno} must be an object with entity_id and service",
+                )
+                raise typer.Exit(1)
+
+            data = entry.get("data") or {}
+            if not isinstance(data, dict):
+                console.print(f"[red]Error:[/red] Line {lineno}: data must be an object")
+                raise typer.Exit(1)
+
+            actions.append((entry["entity_id"], entry["service"], data))
+
+        if not actions:
+            console.print("[yellow]No actions found in file[/yellow]")
+            return
+
+        # Vectorized safety check: one check_actions pass per distinct
+        # service over the unique entities it targets, reporting every
+        # denial instead of stopping at the first.
+        # NB: the set and list commands shadow those builtins in this
+        # module — hence dict keys for dedup and [*ids] to materialize.
+        by_service: dict = {}
+        for entity_id, service, _ in actions:
+            by_service.setdefault(service, {})[entity_id] = True
+
+        for service, ids in by_service.items():
+            _, denials = check_actions([*ids], service, config.safety, force)
+            if denials:
+                for _, exc in denials:
+                    console.print(str(exc))
+                raise typer.Exit(1)
+
+        # Group into one service call per (domain, service, extra data)
+        groups: dict = {}
+        for entity_id, service, data in actions:
+            key = (domain_of(entity_id), service, json.dumps(data, sort_keys=True))
+            groups.setdefault(key, ([], data))[0].append(entity_id)
+
+        def run_group(item):
+            (domain, service, _), (entity_ids, data) = item
+            payload = dict(data)
+            payload["entity_id"] = entity_ids if len(entity_ids) > 1 else entity_ids[0]
+            client.call_service(domain, service, payload)
+            return service, entity_ids
+
+        # Fan heterogeneous groups out concurrently over the shared session
+        if len(groups) == 1:
+            results = [run_group(next(iter(groups.items())))]
+        else:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=min(8, len(groups))) as pool:
+                results = pool.map(run_group, groups.items())
+                results = [result for result in results]
+
+        total = 0
+        for service, entity_ids in results:
+            for entity_id in entity_ids:
+                log_action(entity_id, service, forced=force, allowed=True)
+            total += len(entity_ids)
+
+        console.print(
+            f"[green]✓[/green] {total} action(s) executed in {len(groups)} service call(s)",
+        )
+
+    except CriticalActionError as e:
+        console.print(str(e))
+        raise typer.Exit(1)
+    except PermissionError as e:
+        console.print(str(e))
+        raise typer.Exit(1)
+    except ApiError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+
+# ============================================================================
+# REPL COMMAND
+# ============================================================================
+
+
+@app.command()
+def repl() -> None:
+    """Interactive shell that keeps the process warm between commands.
+
+    Reads one command per line (same syntax as the CLI, without the program
+    name) and dispatches it in-process. Config, logging, and the HTTP
+    session survive across commands, so each one skips interpreter startup,
+    config parsing, and the TCP/TLS handshake. Exit with 'exit', 'quit', or
+    Ctrl-D.
+    """
+    import shlex
+
+    console.print("[bold cyan]moltbot-ha REPL[/bold cyan] — type 'exit' or Ctrl-D to quit")
+
+    while True:
+        try:
+            line = input("moltbot-ha> ")
+        except EOFError:
+            console.print()
+            break
+        except KeyboardInterrupt:
+            console.print()
+            continue
+
+        line = line.strip()
+        if not line:
+            continue
+        if line in ("exit", "quit"):
+            break
+
+        try:
+            args = shlex.split(line)
+        except ValueError as e:
+            console.print(f"[red]Error:[/red] {e}")
+            continue
+
+        if args[0] == "repl":
+            console.print("[yellow]Already in a REPL[/yellow]")
+            continue
+
+        try:
+            app(args, standalone_mode=False)
+        except typer.Exit:
+            pass  # commands signal exit codes; the REPL keeps going
+        except typer.Abort:
+            console.print("[yellow]Aborted[/yellow]")
+        except Exception as e:
+            # Usage/parse errors from the dispatched command; keep the shell alive
+            console.print(f"[red]Error:[/red] {e}")
+
+
 # ============================================================================
 # CONFIG COMMAND
 # ============================================================================
@@ -504,59 +755,12 @@ def config_show() -> None:
     """Show current configuration (token masked)."""
     try:
         config = get_config()
-
-        # Build display dict with masked token
-        config_display = {
-            "server": {
-                "url": config.server.url,
-                "token": "***" + (config.server.token[-4:] if config.server.token else ""),
-            },
-            "safety": {
-                "level": config.safety.level,
-                "critical_domains": config.safety.critical_domains,
-                "blocked_entities": config.safety.blocked_entities,
-                "allowed_entities": config.safety.allowed_entities,
-            },
-            "logging": {
-                "enabled": config.logging.enabled,
-                "path": config.logging.path,
-                "level": config.logging.level,
-            },
-        }
-
-        console.print(json.dumps(config_display, indent=2))
+        _print_json(config.masked_display)
 
     except Exception as e:
         console.print(f"[red]Error:[/red] {e}")
         raise typer.Exit(1)
 
 
-@app.command()
-def test() -> None:
-    """Test connection to Home Assistant."""
-    try:
-        client = get_client()
-        client.test_connection()
-        console.print("[green]✓[/green] Connected to Home Assistant successfully")
-    except ApiError as e:
-        console.print(f"[red]✗[/red] Connection failed: {e}")
-        raise typer.Exit(1)
-
-
-@app.callback()
-def main(
-    version: Optional[bool] = typer.Option(
-        None,
-        "--version",
-        "-v",
-        callback=version_callback,
-        is_eager=True,
-        help="Show version and exit",
-    ),
-) -> None:
-    """Home Assistant control CLI."""
-    pass
-
-
 if __name__ == "__main__":
     app()
@@ -2,18 +2,38 @@
 
 from __future__ import annotations
 
+import atexit
 import logging
-from typing import Any, Dict, List, Optional
-from urllib.parse import urljoin
+from typing import Any, Dict, List, Optional, Tuple
 
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
-from .models import ApiError, EntityState, ServiceCall
+from .models import ApiError, EntityState, ServiceCall, domain_of
+
+# Optional fast JSON decoder (install with: pip install 'moltbot-ha[speed]')
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
 logger = logging.getLogger(__name__)
 
+# Sessions reused across client instances in the same process, keyed by
+# (base_url, token). Keeps TCP/TLS connections warm so repeated commands
+# (REPL, library use, loops) skip the handshake after the first request.
+_SESSION_CACHE: Dict[Tuple[str, str], requests.Session] = {}
+
+
+def _close_sessions() -> None:
+    """Close all cached sessions at interpreter exit."""
+    for session in _SESSION_CACHE.values():
+        session.close()
+
+
+atexit.register(_close_sessions)
+
 
 class HomeAssistantClient:
     """HTTP client for Home Assistant REST API."""
@@ -37,25 +57,41 @@ class HomeAssistantClient:
         self.token = token
         self.timeout = timeout
 
-        # Configure session with retry logic
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "Authorization": f"Bearer {token}",
-                "Content-Type": "application/json",
-            }
-        )
-
-        # Setup retry strategy for transient errors
-        retry_strategy = Retry(
-            total=max_retries,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["HEAD", "GET", "POST", "PUT", "DELETE", "OPTIONS", "TRACE"],
-            backoff_factor=0.3,  # 0.3s, 0.6s, 1.2s delays
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
+        # Reuse a cached session for this server/token if one exists
+        cache_key = (self.base_url, token)
+        session = _SESSION_CACHE.get(cache_key)
+
+        if session is None:
+            # Configure session with retry logic
+            session = requests.Session()
+            session.headers.update(
+                {
+                    "Authorization": f"Bearer {token}",
+                    "Content-Type": "application/json",
+                }
+            )
+
+            # Setup retry strategy for transient errors
+            retry_strategy = Retry(
+                total=max_retries,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=["HEAD", "GET", "POST", "PUT", "DELETE", "OPTIONS", "TRACE"],
+                backoff_factor=0.1,  # 0.1s, 0.2s, 0.4s delays
+                respect_retry_after_header=True,
+            )
+            # Larger pool than the urllib3 default (10) so concurrent batch
+            # calls are not serialized waiting for a free connection
+            adapter = HTTPAdapter(
+                max_retries=retry_strategy,
+                pool_connections=20,
+                pool_maxsize=20,
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+
+            _SESSION_CACHE[cache_key] = session
+
+        self.session = session
 
     def _make_request(
         self,
@@ -76,16 +112,29 @@ class HomeAssistantClient:
         Raises:
             ApiError: On API errors or connection issues
         """
-        url = urljoin(self.base_url, endpoint)
+        # base_url is already rstripped of "/" and endpoints always start
+        # with "/api/", so plain concatenation replaces urljoin's URL parsing
+        url = self.base_url + endpoint
 
         try:
             logger.debug(f"{method} {url}")
-            response = self.session.request(
-                method=method,
-                url=url,
-                json=json_data,
-                timeout=self.timeout,
-            )
+            # Encode the body with orjson when available; requests' json=
+            # path goes through the stdlib encoder. Content-Type is already
+            # application/json on the session headers.
+            if json_data is not None and orjson is not None:
+                response = self.session.request(
+                    method=method,
+                    url=url,
+                    data=orjson.dumps(json_data),
+                    timeout=self.timeout,
+                )
+            else:
+                response = self.session.request(
+                    method=method,
+                    url=url,
+                    json=json_data,
+                    timeout=self.timeout,
+                )
 
             logger.debug(f"Response: {response.status_code}")
 
@@ -98,11 +147,18 @@ class HomeAssistantClient:
                     response=response.text,
                 )
 
-            # Parse JSON response
+            # Parse JSON response; orjson accepts the raw bytes directly,
+            # skipping the UTF-8 decode pass that response.text forces
+            body = response.content
+            if not body:
+                return None
+
             try:
+                if orjson is not None:
+                    return orjson.loads(body)
                 return response.json()
             except ValueError:
-                # Empty or non-JSON response
+                # Non-JSON response
                 return None
 
         except requests.exceptions.ConnectionError as e:
@@ -150,14 +206,28 @@ class HomeAssistantClient:
         logger.info(f"Connected to Home Assistant: {result.get('message', 'OK')}")
         return True
 
-    def get_states(self) -> List[EntityState]:
-        """Get all entity states.
+    def get_states(self, domain: Optional[str] = None) -> List[EntityState]:
+        """Get all entity states, optionally filtered by domain.
+
+        Args:
+            domain: If given, only return entities in this domain. Filtering
+                happens on the raw payload, before model construction, so
+                non-matching entities skip validation entirely.
 
         Returns:
             List of entity states
         """
         data = self._make_request("GET", "/api/states")
-        return [EntityState(**item) for item in data]
+
+        if domain:
+            prefix = domain + "."
+            return [
+                EntityState.from_api(item)
+                for item in data
+                if item["entity_id"].startswith(prefix)
+            ]
+
+        return [EntityState.from_api(item) for item in data]
 
     def get_state(self, entity_id: str) -> EntityState:
         """Get state of a specific entity.
@@ -177,7 +247,7 @@ class HomeAssistantClient:
         if not data:
             raise ApiError(f"Entity not found: {entity_id}", status_code=404)
 
-        return EntityState(**data)
+        return EntityState.from_api(data)
 
     def call_service(
         self,
@@ -217,7 +287,7 @@ class HomeAssistantClient:
         Returns:
             Service call response
         """
-        domain = entity_id.split(".", 1)[0]
+        domain = domain_of(entity_id)
         service_data = data or {}
         service_data["entity_id"] = entity_id
 
@@ -2,21 +2,72 @@
 
 from __future__ import annotations
 
+import fnmatch
 import os
+import re
 import sys
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, List, Optional, Tuple
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
+
+
+@lru_cache(maxsize=1)
+def _get_re2():
+    """Import google-re2 lazily; only wanted when safety.use_re2 is set.
+
+    Returns None when the wheel is not installed so callers fall back to
+    the stdlib engine.
+    """
+    try:
+        import re2
+    except ImportError:
+        return None
+    return re2
+
+
+@lru_cache(maxsize=None)
+def _compile_patterns(patterns: Tuple[str, ...], use_re2: bool = False):
+    """Compile fnmatch patterns into a single alternation regex.
+
+    Safety lists are stable within a process, so the cache hits from the
+    second check onward and each call does one match() instead of
+    translating and matching every glob in the list.
+
+    With use_re2 (and google-re2 installed) the alternation is compiled by
+    RE2's DFA engine, which matches in time linear in the entity ID no
+    matter how many patterns the list holds — worth it for installs with
+    very large blocklists. The stdlib engine remains the fallback and the
+    default; both expose the same match() surface.
+    """
+    joined = "|".join(f"(?:{fnmatch.translate(p)})" for p in patterns)
+    if use_re2 and (re2 := _get_re2()) is not None:
+        # fnmatch.translate anchors with \Z, which RE2 spells \z (translate
+        # escapes any literal backslash, so the replace only hits anchors)
+        try:
+            return re2.compile(joined.replace(r"\Z", r"\z"))
+        except re2.error:
+            pass
+    return re.compile(joined)
+
+
+@lru_cache(maxsize=1)
+def _get_tomllib():
+    """Import tomllib/tomli lazily; the parser is only needed when a config file exists.
+
+    Resolved at most once per process; subsequent calls are a cache hit.
+    """
+    if sys.version_info >= (3, 11):
+        import tomllib
+
+        return tomllib
 
-# Handle tomli/tomllib based on Python version
-if sys.version_info >= (3, 11):
-    import tomllib
-else:
     try:
         import tomli as tomllib
     except ImportError:
-        tomllib = None  # type: ignore
+        return None
+    return tomllib
 
 
 class ServerConfig(BaseModel):
@@ -43,6 +94,49 @@ class SafetyConfig(BaseModel):
     )
     blocked_entities: List[str] = Field(default_factory=list)
     allowed_entities: List[str] = Field(default_factory=list)
+    # Opt-in RE2 pattern matching; default off so plain installs don't
+    # need the google-re2 wheel
+    use_re2: bool = False
+
+    # Derived lookups, computed once per config: safety checks run on every
+    # action and in batch loops, where repeated list scans add up.
+
+    @cached_property
+    def critical_domains_set(self) -> frozenset:
+        """Critical domains as a frozenset of interned strings.
+
+        Interning pairs with the interned EntityState.domain values so
+        membership checks compare pointers before falling back to hashes.
+        """
+        return frozenset(sys.intern(d) for d in self.critical_domains)
+
+    @cached_property
+    def confirm_critical(self) -> bool:
+        """True when critical-domain actions require confirmation (level >= 3)."""
+        return self.level >= 3
+
+    @cached_property
+    def confirm_writes(self) -> bool:
+        """True when all write actions require confirmation (level >= 2)."""
+        return self.level >= 2
+
+    # Annotated Any rather than re.Pattern: with use_re2 the compiled
+    # object comes from google-re2, which shares the match() surface but
+    # not the type.
+
+    @cached_property
+    def blocked_pattern(self) -> Optional[Any]:
+        """Compiled alternation of blocked_entities globs, or None if empty."""
+        if not self.blocked_entities:
+            return None
+        return _compile_patterns(tuple(self.blocked_entities), self.use_re2)
+
+    @cached_property
+    def allowed_pattern(self) -> Optional[Any]:
+        """Compiled alternation of allowed_entities globs, or None if empty."""
+        if not self.allowed_entities:
+            return None
+        return _compile_patterns(tuple(self.allowed_entities), self.use_re2)
 
 
 class LoggingConfig(BaseModel):
@@ -70,6 +164,38 @@ class Config(BaseModel):
     safety: SafetyConfig = Field(default_factory=SafetyConfig)
     logging: LoggingConfig = Field(default_factory=LoggingConfig)
 
+    @cached_property
+    def masked_display(self) -> dict:
+        """Display form of the config with the token masked, built once."""
+        token = self.server.token
+        return {
+            "server": {
+                "url": self.server.url,
+                "token": f"***{token[-4:] if token else ''}",
+            },
+            "safety": {
+                "level": self.safety.level,
+                "critical_domains": self.safety.critical_domains,
+                "blocked_entities": self.safety.blocked_entities,
+                "allowed_entities": self.safety.allowed_entities,
+            },
+            "logging": {
+                "enabled": self.logging.enabled,
+                "path": self.logging.path,
+                "level": self.logging.level,
+            },
+        }
+
+
+@lru_cache(maxsize=1)
+def _config_adapter() -> TypeAdapter:
+    """Build the reusable validator for Config once per process.
+
+    TypeAdapter.validate_python reuses the compiled core schema, which is
+    faster than Config(**...) when load_config misses its cache.
+    """
+    return TypeAdapter(Config)
+
 
 def get_config_path() -> Path:
     """Get the configuration file path."""
@@ -81,9 +207,43 @@ def get_config_path() -> Path:
     return Path("~/.config/moltbot-ha/config.toml").expanduser()
 
 
+# Parsed configs keyed by (config path, file mtime, env overrides) so repeated
+# load_config() calls in the same process skip file I/O and Pydantic validation.
+_CONFIG_CACHE: dict[tuple, Config] = {}
+
+# Environment variables that override file configuration; read in one place
+# so the cache key and the merge logic can't drift apart.
+_ENV_OVERRIDES = ("HA_URL", "HA_TOKEN", "HA_CTL_CONFIG")
+
+
+def _env_overrides() -> tuple:
+    """Snapshot the override environment variables as a tuple."""
+    get = os.environ.get
+    return tuple(get(key) for key in _ENV_OVERRIDES)
+
+
+def _config_cache_key(config_path: Path, env: tuple) -> tuple:
+    """Build the cache key for a config file, including env overrides.
+
+    The file mtime (ns) invalidates the cache when the file changes; the
+    relevant environment variables are part of the key so env overrides
+    take effect without a stale hit.
+    """
+    try:
+        mtime_ns = config_path.stat().st_mtime_ns
+    except OSError:
+        mtime_ns = None
+
+    return (str(config_path), mtime_ns, env)
+
+
 def load_config() -> Config:
     """Load configuration from file and environment variables.
 
+    Results are memoized per (config path, file mtime, env overrides), so
+    repeated calls in the same process are cheap. Use
+    ``load_config.cache_clear()`` to reset (e.g., in tests).
+
     Priority:
     1. Environment variables (highest)
     2. Config file
@@ -98,6 +258,11 @@ def load_config() -> Config:
     """
     config_path = get_config_path()
 
+    env = _env_overrides()
+    cache_key = _config_cache_key(config_path, env)
+    if (cached := _CONFIG_CACHE.get(cache_key)) is not None:
+        return cached
+
     # Start with defaults
     config_dict = {
         "server": {},
@@ -107,6 +272,7 @@ def load_config() -> Config:
 
     # Load from file if exists
     if config_path.exists():
+        tomllib = _get_tomllib()
         if tomllib is None:
             raise RuntimeError(
                 "tomli library is required for Python < 3.11. Install with: pip install tomli"
@@ -118,11 +284,13 @@ def load_config() -> Config:
                 if section in file_config:
                     config_dict[section].update(file_config[section])
 
-    # Override with environment variables (highest priority)
-    if ha_url := os.getenv("HA_URL"):
+    # Override with environment variables (highest priority), reusing the
+    # snapshot already taken for the cache key
+    ha_url, ha_token, _ = env
+    if ha_url:
         config_dict["server"]["url"] = ha_url
 
-    if ha_token := os.getenv("HA_TOKEN"):
+    if ha_token:
         config_dict["server"]["token"] = ha_token
 
     # Validate we have required fields
@@ -138,8 +306,13 @@ def load_config() -> Config:
             "Set HA_TOKEN environment variable or configure in config file."
         )
 
-    # Parse and validate with Pydantic
-    return Config(**config_dict)
+    # Parse and validate with Pydantic via the reusable adapter
+    config = _config_adapter().validate_python(config_dict)
+    _CONFIG_CACHE[cache_key] = config
+    return config
+
+
+load_config.cache_clear = _CONFIG_CACHE.clear  # type: ignore[attr-defined]
 
 
 def init_config(
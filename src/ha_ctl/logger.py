@@ -1,12 +1,44 @@
 """Logging setup for moltbot-ha."""
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from pathlib import Path
 from typing import List, Optional
 
 from .config import LoggingConfig
 
+# Formatters are stateless and shared across handlers; built once at import
+# so repeated setup_logging calls (tests, reloads) don't reconstruct them
+_DETAILED_FORMATTER = logging.Formatter(
+    "[%(asctime)s] [%(levelname)s] %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
+)
+_SIMPLE_FORMATTER = logging.Formatter("%(message)s")
+
+# Background listener draining the log queue; kept at module scope so a
+# repeated setup_logging call can stop the previous one.
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _stop_listener() -> None:
+    """Stop the queue listener, flushing any buffered records."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        for handler in _queue_listener.handlers:
+            try:
+                handler.flush()
+            except ValueError:
+                # Stream already closed (interpreter teardown, captured
+                # stderr in tests); nothing left to flush to
+                pass
+        _queue_listener = None
+
+
+atexit.register(_stop_listener)
+
 
 def setup_logging(config: Optional[LoggingConfig] = None) -> None:
     """Setup logging based on configuration.
@@ -14,24 +46,23 @@ def setup_logging(config: Optional[LoggingConfig] = None) -> None:
     Args:
         config: Logging configuration. If None, uses default console logging.
     """
-    # Default to INFO level console logging
+    # Default to INFO level console logging. force=True replaces any
+    # handlers from an earlier setup_logging call (basicConfig is a no-op
+    # otherwise), so a stale QueueHandler can't keep feeding a stopped
+    # listener's queue.
     if config is None:
+        _stop_listener()
         logging.basicConfig(
             level=logging.INFO,
             format="%(message)s",
             handlers=[logging.StreamHandler(sys.stderr)],
+            force=True,
         )
         return
 
     # Parse log level
     log_level = getattr(logging, config.level, logging.INFO)
 
-    # Setup formatters
-    detailed_formatter = logging.Formatter(
-        "[%(asctime)s] [%(levelname)s] %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
-    )
-    simple_formatter = logging.Formatter("%(message)s")
-
     # Setup handlers
     handlers: List[logging.Handler] = []
 
@@ -42,19 +73,49 @@ def setup_logging(config: Optional[LoggingConfig] = None) -> None:
 
         file_handler = logging.FileHandler(log_path)
         file_handler.setLevel(log_level)
-        file_handler.setFormatter(detailed_formatter)
-        handlers.append(file_handler)
+        file_handler.setFormatter(_DETAILED_FORMATTER)
+
+        # Batch file writes: buffer records and flush on WARNING+ (or when
+        # full), instead of one write syscall per emitted record
+        buffered_handler = logging.handlers.MemoryHandler(
+            capacity=256,
+            flushLevel=logging.WARNING,
+            target=file_handler,
+        )
+        buffered_handler.setLevel(log_level)
+        handlers.append(buffered_handler)
 
     # Console handler (always present for CLI output)
     console_handler = logging.StreamHandler(sys.stderr)
     console_handler.setLevel(logging.WARNING)  # Only warnings/errors to console
-    console_handler.setFormatter(simple_formatter)
+    console_handler.setFormatter(_SIMPLE_FORMATTER)
     handlers.append(console_handler)
 
-    # Configure root logger
+    # Route records through a queue: the emitting thread only enqueues,
+    # and a background listener does the formatting and writes
+    _stop_listener()
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+
+    global _queue_listener
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    _queue_listener.start()
+
+    # Message-only formatter on the queue handler: QueueHandler.prepare
+    # pre-formats the record, and without this basicConfig would attach its
+    # BASIC_FORMAT formatter, baking "LEVEL:name:" into the message before
+    # the real handlers format it
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(_SIMPLE_FORMATTER)
+
+    # Configure root logger; force=True swaps out the previous setup's
+    # handlers so re-running setup (config reload, tests) reroutes records
+    # to the new queue instead of silently dropping them
     logging.basicConfig(
         level=log_level,
-        handlers=handlers,
+        handlers=[queue_handler],
+        force=True,
     )
 
     # Suppress noisy third-party loggers
@@ -73,15 +134,21 @@ def log_action(entity_id: str, action: str, forced: bool = False, allowed: bool
     """
     logger = logging.getLogger(__name__)
 
-    status = "ALLOWED" if allowed else "DENIED"
-    force_flag = " [FORCED]" if forced else ""
-
-    log_message = f"{status}: {action} on {entity_id}{force_flag}"
-
     if allowed:
-        if forced:
-            logger.warning(log_message)
-        else:
-            logger.info(log_message)
+        level = logging.WARNING if forced else logging.INFO
     else:
-        logger.error(log_message)
+        level = logging.ERROR
+
+    # Bail out before any string work when the record would be filtered;
+    # %-style args defer formatting to the handler that consumes the record
+    if not logger.isEnabledFor(level):
+        return
+
+    logger.log(
+        level,
+        "%s: %s on %s%s",
+        "ALLOWED" if allowed else "DENIED",
+        action,
+        entity_id,
+        " [FORCED]" if forced else "",
+    )
@@ -2,26 +2,106 @@
 
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Any, Dict, Optional, Tuple
+import sys
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
 
 from pydantic import BaseModel, Field
 
-
-class EntityState(BaseModel):
-    """Represents a Home Assistant entity state."""
+# Shared immutable empty mapping used when the API sends no attributes or
+# context; saves one dict allocation per such entity in large state lists
+_EMPTY_MAPPING: Mapping[str, Any] = MappingProxyType({})
+
+# Guidance text for CriticalActionError, kept as one module-level literal
+# so rendering is a single .format() over an already-interned template
+_CRITICAL_MSG_TMPL = (
+    "⚠️  CRITICAL ACTION REQUIRES CONFIRMATION\n\n"
+    "Action: {action} on {entity_id}\n\n"
+    "This is a critical operation that requires explicit user approval.\n"
+    "Ask the user for confirmation (e.g., 'Do you want to proceed?').\n"
+    "If the user confirms (e.g., says 'Yes', 'OK', 'Confirm'), retry with --force flag.\n\n"
+    "Example: moltbot-ha {action} {entity_id} --force"
+)
+
+
+def domain_of(entity_id: str) -> str:
+    """Extract the domain from an entity ID (e.g., 'light' from 'light.kitchen').
+
+    find + slice instead of split(".", 1)[0]: avoids allocating a throwaway
+    list per call, which adds up when filtering large entity lists. The
+    result is interned — the same handful of domains recurs across
+    thousands of entities, so equality and set membership become pointer
+    compares.
+    """
+    i = entity_id.find(".")
+    return sys.intern(entity_id[:i] if i > 0 else entity_id)
+
+
+def _parse_timestamp(value: Any) -> float:
+    """Parse an ISO-8601 timestamp from the API into a POSIX timestamp.
+
+    Tolerates a trailing 'Z'. Floats compare and sort faster than tz-aware
+    datetimes, so timestamps are stored numerically and turned back into
+    datetime objects only on demand.
+    """
+    if isinstance(value, datetime):
+        return value.timestamp()
+    return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+
+
+@dataclass(slots=True)
+class EntityState:
+    """Represents a Home Assistant entity state.
+
+    A plain dataclass rather than a Pydantic model: /api/states returns
+    hundreds of these per call and per-field validation dominated the cost
+    of building them. slots=True drops the per-instance __dict__, roughly
+    halving memory for large state lists. Use from_api() to construct from
+    raw API payloads.
+    """
 
     entity_id: str
     state: str
-    attributes: Dict[str, Any] = Field(default_factory=dict)
-    last_changed: datetime
-    last_updated: datetime
-    context: Dict[str, Any] = Field(default_factory=dict)
+    last_changed_ts: float
+    last_updated_ts: float
+    # default_factory returns the shared proxy (dataclasses reject an
+    # unhashable object as a plain default), so no dict is allocated
+    attributes: Mapping[str, Any] = field(default_factory=lambda: _EMPTY_MAPPING)
+    context: Mapping[str, Any] = field(default_factory=lambda: _EMPTY_MAPPING)
+    # Computed once at construction: callers (filtering, safety checks,
+    # grouping) read it many times per entity
+    domain: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.domain = sys.intern(self.entity_id.partition(".")[0])
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> "EntityState":
+        """Build an EntityState from one raw /api/states payload item.
+
+        Unknown keys are ignored; timestamps are parsed in a single pass
+        with datetime.fromisoformat.
+        """
+        return cls(
+            entity_id=data["entity_id"],
+            state=data["state"],
+            last_changed_ts=_parse_timestamp(data["last_changed"]),
+            last_updated_ts=_parse_timestamp(data["last_updated"]),
+            attributes=data.get("attributes") or _EMPTY_MAPPING,
+            context=data.get("context") or _EMPTY_MAPPING,
+        )
 
     @property
-    def domain(self) -> str:
-        """Extract domain from entity_id (e.g., 'light' from 'light.kitchen')."""
-        return self.entity_id.split(".", 1)[0]
+    def last_changed(self) -> datetime:
+        """Last state change as an aware UTC datetime, built on demand."""
+        return datetime.fromtimestamp(self.last_changed_ts, tz=timezone.utc)
+
+    @property
+    def last_updated(self) -> datetime:
+        """Last update as an aware UTC datetime, built on demand."""
+        return datetime.fromtimestamp(self.last_updated_ts, tz=timezone.utc)
 
     @property
     def friendly_name(self) -> str:
@@ -42,7 +122,7 @@ class ServiceCall(BaseModel):
         cls, entity_id: str, service: str, data: Optional[Dict[str, Any]] = None
     ) -> "ServiceCall":
         """Create a ServiceCall from entity_id and service name."""
-        domain = entity_id.split(".", 1)[0]
+        domain = sys.intern(entity_id.partition(".")[0])
         call_data = data or {}
         call_data["entity_id"] = entity_id
         return cls(domain=domain, service=service, data=call_data)
@@ -50,14 +130,21 @@ class ServiceCall(BaseModel):
     @classmethod
     def parse_service_string(cls, service_string: str) -> Tuple[str, str]:
         """Parse 'domain.service' string into (domain, service)."""
-        if "." not in service_string:
+        domain, sep, service = service_string.partition(".")
+        if not sep:
             raise ValueError(f"Invalid service format: {service_string}. Expected 'domain.service'")
-        domain, service = service_string.split(".", 1)
         return domain, service
 
 
 class ApiError(Exception):
-    """Custom exception for Home Assistant API errors."""
+    """Custom exception for Home Assistant API errors.
+
+    __slots__ keeps the fixed attributes out of a per-instance __dict__;
+    exceptions lazily allocate that dict, so slotted instances raised and
+    caught in bulk probe loops never pay for one.
+    """
+
+    __slots__ = ("message", "status_code", "response")
 
     def __init__(
         self, message: str, status_code: Optional[int] = None, response: Optional[Any] = None
@@ -74,17 +161,22 @@ class ApiError(Exception):
 
 
 class CriticalActionError(Exception):
-    """Exception raised when a critical action requires user confirmation."""
+    """Exception raised when a critical action requires user confirmation.
+
+    Slotted for the same reason as ApiError: batch pre-flight checks
+    construct one of these per denied entity.
+    """
+
+    __slots__ = ("entity_id", "action", "summary")
 
     def __init__(self, entity_id: str, action: str):
         self.entity_id = entity_id
         self.action = action
-        message = (
-            f"⚠️  CRITICAL ACTION REQUIRES CONFIRMATION\n\n"
-            f"Action: {action} on {entity_id}\n\n"
-            f"This is a critical operation that requires explicit user approval.\n"
-            f"Ask the user for confirmation (e.g., 'Do you want to proceed?').\n"
-            f"If the user confirms (e.g., says 'Yes', 'OK', 'Confirm'), retry with --force flag.\n\n"
-            f"Example: moltbot-ha {action} {entity_id} --force"
-        )
-        super().__init__(message)
+        # Short summary only; the full guidance text is built lazily in
+        # __str__. Bulk pre-flight checks raise and catch many of these
+        # without ever rendering the message.
+        self.summary = f"Critical action requires confirmation: {action} on {entity_id}"
+        super().__init__(self.summary)
+
+    def __str__(self) -> str:
+        return _CRITICAL_MSG_TMPL.format(action=self.action, entity_id=self.entity_id)
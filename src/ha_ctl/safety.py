@@ -2,15 +2,31 @@
 
 from __future__ import annotations
 
-import fnmatch
 import logging
-from typing import List, Optional
+import sys
+from typing import List, Optional, Sequence, Tuple
 
-from .config import Config, SafetyConfig
+from .config import Config, SafetyConfig, _compile_patterns
 from .models import CriticalActionError
 
 logger = logging.getLogger(__name__)
 
+# Actions that modify entity state; frozenset for O(1) hashed membership
+_WRITE_ACTIONS: frozenset = frozenset({"turn_on", "turn_off", "toggle", "set"})
+
+# Shared default config, built lazily: check_action runs per action and
+# constructing a fresh SafetyConfig each call is measurable on fast paths.
+# A concurrent first call at worst builds it twice, which is harmless.
+_DEFAULT_SAFETY: Optional[SafetyConfig] = None
+
+
+def _default_safety() -> SafetyConfig:
+    """Return the module-wide default SafetyConfig, creating it on first use."""
+    global _DEFAULT_SAFETY
+    if _DEFAULT_SAFETY is None:
+        _DEFAULT_SAFETY = SafetyConfig()
+    return _DEFAULT_SAFETY
+
 
 def check_action(
     entity_id: str,
@@ -30,17 +46,18 @@ def check_action(
         CriticalActionError: If action requires user confirmation
         PermissionError: If entity is blocked
     """
-    # Use default safety config if not provided
+    # Use the shared default safety config if not provided
     if config is None:
-        config = SafetyConfig()
+        config = _default_safety()
 
     # Safety level 0: no checks
     if config.level == 0:
         logger.debug(f"Safety level 0: allowing {action} on {entity_id}")
         return
 
-    # Check blocked entities (always enforced, even with --force)
-    if is_blocked(entity_id, config.blocked_entities):
+    # Check blocked entities (always enforced, even with --force);
+    # one match against the precompiled alternation stored on the config
+    if config.blocked_pattern is not None and config.blocked_pattern.match(entity_id):
         logger.error(f"BLOCKED: {action} on {entity_id} (entity in blocked list)")
         raise PermissionError(
             f"❌ Entity {entity_id} is BLOCKED in configuration.\n"
@@ -49,7 +66,7 @@ def check_action(
         )
 
     # Check allowlist if configured
-    if config.allowed_entities and not is_allowed(entity_id, config.allowed_entities):
+    if config.allowed_pattern is not None and not config.allowed_pattern.match(entity_id):
         logger.error(f"DENIED: {action} on {entity_id} (not in allowlist)")
         raise PermissionError(
             f"❌ Entity {entity_id} is not in the allowlist.\n"
@@ -57,10 +74,10 @@ def check_action(
         )
 
     # Extract domain from entity_id
-    domain = entity_id.split(".", 1)[0]
+    domain = get_domain(entity_id)
 
     # Safety level 3: check critical domains
-    if config.level >= 3 and domain in config.critical_domains:
+    if config.confirm_critical and domain in config.critical_domains_set:
         if not force:
             logger.warning(f"CRITICAL: {action} on {entity_id} requires confirmation")
             raise CriticalActionError(entity_id, action)
@@ -68,7 +85,7 @@ def check_action(
             logger.warning(f"FORCED: {action} on {entity_id} (critical domain, using --force)")
 
     # Safety level 2: all write operations require confirmation
-    if config.level >= 2 and action in ["turn_on", "turn_off", "toggle", "set"]:
+    if config.confirm_writes and action in _WRITE_ACTIONS:
         if not force:
             logger.info(f"CONFIRM: {action} on {entity_id} (safety level 2)")
             raise CriticalActionError(entity_id, action)
@@ -77,6 +94,94 @@ def check_action(
     logger.debug(f"ALLOWED: {action} on {entity_id}")
 
 
+def check_actions(
+    entity_ids: Sequence[str],
+    action: str,
+    config: Optional[SafetyConfig] = None,
+    force: bool = False,
+) -> Tuple[List[str], List[Tuple[str, Exception]]]:
+    """Check an action against many entities in one pass.
+
+    Bulk callers previously invoked check_action per entity, repeating the
+    same config attribute lookups, pattern fetches, and action-set
+    membership test N times. Here everything that does not depend on the
+    entity is hoisted out of the loop, and the loop itself is a few
+    compiled-regex match() calls and set probes per entity.
+
+    Unlike check_action this never raises mid-loop: each entity is
+    classified and the result is returned, so one denial does not hide the
+    rest.
+
+    Args:
+        entity_ids: Target entity IDs
+        action: Action name applied to every entity
+        config: Safety configuration. If None, uses default (level 3)
+        force: Whether --force flag was provided
+
+    Returns:
+        (allowed_ids, denials) where denials pairs each denied entity ID
+        with the exception check_action would have raised for it.
+    """
+    if config is None:
+        config = _default_safety()
+
+    denials: List[Tuple[str, Exception]] = []
+
+    if config.level == 0:
+        return list(entity_ids), denials
+
+    # Hoist per-config work out of the loop
+    blocked_pattern = config.blocked_pattern
+    allowed_pattern = config.allowed_pattern
+    critical_domains = config.critical_domains_set if config.confirm_critical else None
+    confirm_write = config.confirm_writes and action in _WRITE_ACTIONS
+
+    allowed: List[str] = []
+    for entity_id in entity_ids:
+        if blocked_pattern is not None and blocked_pattern.match(entity_id):
+            logger.error(f"BLOCKED: {action} on {entity_id} (entity in blocked list)")
+            denials.append(
+                (
+                    entity_id,
+                    PermissionError(
+                        f"❌ Entity {entity_id} is BLOCKED in configuration.\n"
+                        f"This entity cannot be controlled via moltbot-ha for safety reasons.\n"
+                        f"Remove from blocked_entities in config to allow."
+                    ),
+                )
+            )
+            continue
+
+        if allowed_pattern is not None and not allowed_pattern.match(entity_id):
+            logger.error(f"DENIED: {action} on {entity_id} (not in allowlist)")
+            denials.append(
+                (
+                    entity_id,
+                    PermissionError(
+                        f"❌ Entity {entity_id} is not in the allowlist.\n"
+                        f"Add to allowed_entities in config to allow access."
+                    ),
+                )
+            )
+            continue
+
+        if critical_domains is not None and get_domain(entity_id) in critical_domains:
+            if not force:
+                logger.warning(f"CRITICAL: {action} on {entity_id} requires confirmation")
+                denials.append((entity_id, CriticalActionError(entity_id, action)))
+                continue
+            logger.warning(f"FORCED: {action} on {entity_id} (critical domain, using --force)")
+
+        if confirm_write and not force:
+            logger.info(f"CONFIRM: {action} on {entity_id} (safety level 2)")
+            denials.append((entity_id, CriticalActionError(entity_id, action)))
+            continue
+
+        allowed.append(entity_id)
+
+    return allowed, denials
+
+
 def is_blocked(entity_id: str, blocked_list: List[str]) -> bool:
     """Check if entity is in blocked list (supports wildcards).
 
@@ -87,10 +192,9 @@ def is_blocked(entity_id: str, blocked_list: List[str]) -> bool:
     Returns:
         True if entity is blocked
     """
-    for pattern in blocked_list:
-        if fnmatch.fnmatch(entity_id, pattern):
-            return True
-    return False
+    if not blocked_list:
+        return False
+    return _compile_patterns(tuple(blocked_list)).match(entity_id) is not None
 
 
 def is_allowed(entity_id: str, allowed_list: List[str]) -> bool:
@@ -106,10 +210,7 @@ def is_allowed(entity_id: str, allowed_list: List[str]) -> bool:
     if not allowed_list:
         return True  # Empty allowlist means everything is allowed
 
-    for pattern in allowed_list:
-        if fnmatch.fnmatch(entity_id, pattern):
-            return True
-    return False
+    return _compile_patterns(tuple(allowed_list)).match(entity_id) is not None
 
 
 def get_domain(entity_id: str) -> str:
@@ -121,4 +222,4 @@ def get_domain(entity_id: str) -> str:
     Returns:
         Domain (e.g., light)
     """
-    return entity_id.split(".", 1)[0]
+    return sys.intern(entity_id.partition(".")[0])